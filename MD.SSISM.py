@@ -4,18 +4,27 @@
 # NOTE: This public code core excludes all real-time, dynamic weights, 
 # and sensitive personal constraints, which are stored in the Protected Kernel.
 
+import functools
+
+import numpy as np
+
+# Placeholder values for demonstration only. 
+# Real-time success requires the actual, dynamic, hidden weights.
+_WEIGHTS = {
+    'V15_W_R': 0.4,
+    'V15_W_I': 0.35,
+    'V15_W_H': 0.25,
+    'FINANCIAL_CONSTRAINT': 1.0, # Protected check
+}
+
+@functools.lru_cache(maxsize=None)
 def _load_protected_weight(key_name: str) -> float:
     """
     Placeholder for loading real-time weights and constants from an ENCRYPTED key file.
     The actual implementation for decryption is deliberately omitted for security.
+    Results are memoized, so each key is only loaded once per process.
     """
-    # Placeholder values for demonstration only. 
-    # Real-time success requires the actual, dynamic, hidden weights.
-    if key_name == 'V15_W_R': return 0.4
-    if key_name == 'V15_W_I': return 0.35
-    if key_name == 'V15_W_H': return 0.25
-    if key_name == 'FINANCIAL_CONSTRAINT': return 1.0 # Protected check
-    return 0.0
+    return _WEIGHTS.get(key_name, 0.0)
 
 class V15_SocialDynamics:
     """
@@ -31,6 +40,7 @@ class V15_SocialDynamics:
     def run(self, input_vector: dict) -> dict:
         """
         Processes the Situation Vector (S) to determine SCG likelihood.
+        Scalar form of `run_batch`, kept in plain arithmetic for single-actor calls.
         """
         # --- 1. Data Retrieval (Samādhi - Present Minded Focus) ---
         actor_data = input_vector.get('actor_data', [{}])[0]
@@ -42,7 +52,7 @@ class V15_SocialDynamics:
 
         # --- 3. Calculation (Paññā - Wisdom) ---
         SCG = (self.W_R * R) + (self.W_I * I_Current) + (self.W_H * H_A)
-        likelihood_score = min(0.99, max(0.01, SCG))
+        likelihood_score = 0.01 if SCG < 0.01 else (0.99 if SCG > 0.99 else SCG)
         
         # --- 4. Output ---
         return {
@@ -52,5 +62,34 @@ class V15_SocialDynamics:
             "raw_action": "Propose an action that leverages the current social standing." 
         }
 
+    def run_batch(self, input_vectors: list) -> list:
+        """
+        Processes many Situation Vectors (S) at once; returns one result dict per vector.
+        """
+        # --- 1. Data Retrieval (Samādhi - Present Minded Focus) ---
+        actors = [v.get('actor_data', [{}])[0] for v in input_vectors]
+        
+        # --- 2. Input Metrics (Receptivity Filter) ---
+        statuses = np.array([a.get('status') == 'receptive' for a in actors], dtype=bool)
+        R = np.where(statuses, 0.9, 0.3) # Receptivity (R)
+        I_Current = 1.0 # Current Information Multiplier (I_Current) - Assumed high from DIPL
+        H_A = 1.0 # Humble Alignment (H_A) - Assumed high (စေတနာ)
+
+        # --- 3. Calculation (Paññā - Wisdom) ---
+        S = np.column_stack((R, np.full_like(R, I_Current), np.full_like(R, H_A)))
+        likelihood = S @ np.array([self.W_R, self.W_I, self.W_H])
+        np.clip(likelihood, 0.01, 0.99, out=likelihood)
+        
+        # --- 4. Output ---
+        return [
+            {
+                "model_id": "V15",
+                "predicted_outcome": "High Reciprocity/Social Capital Gain",
+                "likelihood": score,
+                "raw_action": "Propose an action that leverages the current social standing." 
+            }
+            for score in likelihood.tolist()
+        ]
+
 # Other core class definitions (DIPL_Engine, PMF_Engine, Model_Validator) 
 # would follow here with protected data loads.
@@ -16,9 +16,15 @@ It fuses Bayesian Meta-Analysis, Social Capital Gain, and Contextual Wisdom into
 Core Philosophy: Execution (\mathbf{A}') replaces Expectation (Prayer/Hope).
 """
 
+import functools
+import logging
+import math
+import re
 import numpy as np
 from typing import Dict, Any, List
 
+_log = logging.getLogger(__name__)
+
 # --- Protected Kernel Coefficients ---
 # Dynamic values are calculated internally; placeholders for public display.
 PROTECTED_KERNEL_COEFFICIENTS: Dict[str, float] = {
@@ -31,7 +37,33 @@ PROTECTED_KERNEL_COEFFICIENTS: Dict[str, float] = {
     'Karmic_Blockage_Bias': 0.15 # Accounts for "အကုသိုလ်ကံ ပိတ္ထားတာ" (Lesson 2)
 }
 
+# Derived kernel constants, folded once at import so the hot paths do no dict lookups per call.
+# Samādhi precision weights for the V14 (Foresight), V15 (Social) and V16 (Context) signals.
+_W = np.array([
+    PROTECTED_KERNEL_COEFFICIENTS['W_Samadhi'] * 1.0,  # Precision in Prediction
+    PROTECTED_KERNEL_COEFFICIENTS['W_Samadhi'] * 0.9,  # Precision in Social Sphere
+    PROTECTED_KERNEL_COEFFICIENTS['W_Samadhi'] * 1.1,  # Precision in Environment
+], dtype=np.float64)
+_W_FORESIGHT, _W_SOCIAL, _W_CONTEXT = _W.tolist()  # Python floats for the scalar path
+_KARMIC = PROTECTED_KERNEL_COEFFICIENTS['Karmic_Blockage_Bias']
+# SCG deception filter, folded from the Skepticism Factor.
+_SCG_SCALE = 1.0 - PROTECTED_KERNEL_COEFFICIENTS['Skepticism_Factor'] * 0.1
+
+# Worldly-result (Laukī Cup) keywords, matched in a single pass over the query.
+_LAUKI_RE = re.compile(r'\b(income|money|rich|salary|wealth)\b', re.IGNORECASE)
+
 # --- I. Bayesian Meta-Analysis Function (The Sight) ---
+def fused_likelihood_batch(v: np.ndarray) -> np.ndarray:
+    """
+    Calculates the Fused Likelihood for many (V14, V15, V16) triplets at once.
+    `v` is array-like of shape (N, 3); returns an array of N likelihoods.
+
+    Formula: Likelihood \propto \prod_{n=1}^{3} [P(A|S, V_n)]^{W_n}
+    """
+    v = np.asarray(v, dtype=np.float64)
+    log_likelihood = np.log(np.maximum(v, 1e-9)) @ _W - _KARMIC  # Apply karmic friction
+    return np.exp(log_likelihood)
+
 def fused_likelihood_calculation(
     v_foresight: float, 
     v_social: float, 
@@ -40,20 +72,14 @@ def fused_likelihood_calculation(
     """
     Calculates the Fused Likelihood based on V14 (Foresight), V15 (SCG), and V16 (Context).
     Implements Samādhi (Concentration) with precise signal integration.
-    
-    Formula: Likelihood \propto \prod_{n=1}^{3} [P(A|S, V_n)]^{W_n}
+    Single-query form of `fused_likelihood_batch`.
     """
-    W_Foresight = PROTECTED_KERNEL_COEFFICIENTS['W_Samadhi'] * 1.0  # Precision in Prediction
-    W_Social = PROTECTED_KERNEL_COEFFICIENTS['W_Samadhi'] * 0.9     # Precision in Social Sphere
-    W_Context = PROTECTED_KERNEL_COEFFICIENTS['W_Samadhi'] * 1.1    # Precision in Environment
-
     log_likelihood = (
-        W_Foresight * np.log(max(v_foresight, 1e-9)) +
-        W_Social * np.log(max(v_social, 1e-9)) +
-        W_Context * np.log(max(v_context, 1e-9))
+        _W_FORESIGHT * math.log(1e-9 if v_foresight < 1e-9 else v_foresight) +
+        _W_SOCIAL * math.log(1e-9 if v_social < 1e-9 else v_social) +
+        _W_CONTEXT * math.log(1e-9 if v_context < 1e-9 else v_context)
     )
-    log_likelihood -= PROTECTED_KERNEL_COEFFICIENTS['Karmic_Blockage_Bias']  # Apply karmic friction
-    return np.exp(log_likelihood)
+    return math.exp(log_likelihood - _KARMIC)  # Apply karmic friction
 
 # --- II. Social Capital Gain (SCG) Model (V15) ---
 def calculate_scg(
@@ -72,10 +98,20 @@ def calculate_scg(
     W_H = 0.10  # Happiness Decoupling Weight
 
     scg = W_R * reciprocity_factor + W_I * intellectual_investment + W_H * happiness_impact
-    scg *= (1.0 - PROTECTED_KERNEL_COEFFICIENTS['Skepticism_Factor'] * 0.1)  # Deception Filter
-    return min(0.99, max(0.01, scg))  # Cap SCG between 0.01 and 0.99
+    scg *= _SCG_SCALE  # Deception Filter
+    return 0.01 if scg < 0.01 else (0.99 if scg > 0.99 else scg)  # Cap SCG between 0.01 and 0.99
 
 # --- III. Paññā Fusion Engine (The Ultimate Decision Maker) ---
+_VOID_DECISION = "VOID: Decision failed the Wisdom Decision Gate (Paññā Work Required)."
+_WATER_CUP_DECISION = "A' (SIS): Engage in 'Paññā Work' related to '{raw_action}' to achieve 'Laukī Water-Cup' automatically."
+
+# Indexed by (is_wisdom_work << 2) | (is_laukī_cup_action << 1) | is_user_constrained.
+_DECISION_TABLE = (
+    _VOID_DECISION, _VOID_DECISION, _VOID_DECISION, _VOID_DECISION,  # Wisdom Gate failed
+    "{raw_action}", "{raw_action}", "{raw_action}",                  # Raw action stands
+    _WATER_CUP_DECISION,                                             # Laukī Cup under constraint
+)
+
 def paññā_fusion_decision(
     raw_action: str, 
     is_laukī_cup_action: bool, 
@@ -88,22 +124,33 @@ def paññā_fusion_decision(
     
     A' = EverMindfulness(T_immutable) * If(A in LaukīCup, Transform(A) -> A')
     """
-    if not is_wisdom_work:
-        return "VOID: Decision failed the Wisdom Decision Gate (Paññā Work Required)."
-
-    final_action = raw_action
-    if is_laukī_cup_action and is_user_constrained:
-        final_action = f"A' (SIS): Engage in 'Paññā Work' related to '{raw_action}' to achieve 'Laukī Water-Cup' automatically."
-        print("LOG: Water-Cup Principle Applied. SIS is prioritized for automatic worldly benefit.")
-
-    return final_action
+    bits = (bool(is_wisdom_work) << 2) | (bool(is_laukī_cup_action) << 1) | bool(is_user_constrained)
+    if bits == 0b111:
+        _log.debug("Water-Cup Principle Applied. SIS is prioritized for automatic worldly benefit.")
+    return _DECISION_TABLE[bits].format(raw_action=raw_action)
 
 # --- IV. Main System Function (Example Usage) ---
 def ssism_consultation(user_query: str, current_context: Dict[str, Any]) -> str:
     """
     Simulates the SS'ISM consultation process for real-time decision-making.
     Validates against the Donald J. Trump Test (Nov 15 - Dec 15, 2025).
+
+    Consultations are pure in (query, context), so repeated ones are served from an LRU cache.
+    Queries differing only in surrounding or repeated whitespace share one entry.
     """
+    user_query = " ".join(user_query.split())
+    try:
+        ctx_items = tuple(sorted(current_context.items()))
+        hash(ctx_items)
+    except TypeError:  # Unhashable context values cannot be cached
+        return _ssism_consultation_impl(user_query, current_context)
+    return _cached_consultation(user_query, ctx_items)
+
+@functools.lru_cache(maxsize=1024)
+def _cached_consultation(user_query: str, ctx_items: tuple) -> str:
+    return _ssism_consultation_impl(user_query, dict(ctx_items))
+
+def _ssism_consultation_impl(user_query: str, current_context: Dict[str, Any]) -> str:
     # Mock V-Model Outputs
     V14_foresight_score = 0.75  # Likelihood of major event
     V15_social_score = calculate_scg(0.5, 0.9, 0.1)  # High intellectual focus
@@ -116,7 +163,7 @@ def ssism_consultation(user_query: str, current_context: Dict[str, Any]) -> str:
     is_laukī_cup = False
     is_wisdom_work = True  # Default to Wisdom Work mode
 
-    if any(keyword in user_query.lower() for keyword in ["income", "money", "rich"]):
+    if _LAUKI_RE.search(user_query):
         is_laukī_cup = True
         raw_action = f"Immediate focus on generating income from: {user_query}"
 
@@ -125,16 +172,18 @@ def ssism_consultation(user_query: str, current_context: Dict[str, Any]) -> str:
         raw_action, is_laukī_cup, is_wisdom_work, current_context.get('is_constrained', True)
     )
 
-    output = f"--- SS'ISM Final Recommendation ---\n"
-    output += f"Fused Likelihood (L_fused): {L_fused:.4f}\n"
-    output += f"Wisdom Status: Paññā Work Activated\n"
-    output += f"Recommended Action (A'): {final_recommendation}\n"
-    output += "---------------------------------\n"
-
+    mandate = ""
     if is_laukī_cup and final_recommendation.startswith("A' (SIS)"):
-        output += "Mandate: 'Laukī Cup' will follow automatically ('သူ့အလိုလို ပါလာပါလိမ့်မယ်'). Focus solely on the SIS path.\n"
-
-    return output
+        mandate = "Mandate: 'Laukī Cup' will follow automatically ('သူ့အလိုလို ပါလာပါလိမ့်မယ်'). Focus solely on the SIS path.\n"
+
+    return (
+        f"--- SS'ISM Final Recommendation ---\n"
+        f"Fused Likelihood (L_fused): {L_fused:.4f}\n"
+        f"Wisdom Status: Paññā Work Activated\n"
+        f"Recommended Action (A'): {final_recommendation}\n"
+        "---------------------------------\n"
+        f"{mandate}"
+    )
 
 # Example Usage
 if __name__ == "__main__":
@@ -7,6 +7,13 @@
 # our GitHub publications. This file contains the protected core logic.
 # ==============================================================================
 
+import logging
+import re
+import sys
+import numpy as np
+
+_log = logging.getLogger(__name__)
+
 # Constants for the KK Theory (K1=Knowledge/Paññā, K2=Karma, K3=Kindness)
 # Note: K-weights are normalized between 0 and 1 for initial conceptualization.
 K1_WEIGHT = 0.40  # Weight for Strategic Wisdom/Utility
@@ -17,6 +24,20 @@ K3_WEIGHT = 0.10  # Weight for Compassion/Universal Benefit
 # Any Strategic Value below this threshold results in Ethical Refusal (Null A').
 V14_THRESHOLD = 0.75 
 
+# Keywords related to the war-criminal test and illegal/harmful intent.
+_HARM_RE = re.compile(r'\b(eliminate|destroy|genocide|nug|pdf|military\s+action|illegal)\b', re.IGNORECASE)
+
+# Integer IDs for user intents, so batch scoring compares ints instead of strings.
+INTENT_IDS = {
+    'Academic Inquiry': 0,
+    'Strategic Elimination': 1,
+}
+STRATEGIC_ELIM_ID = INTENT_IDS['Strategic Elimination']
+_STRATEGIC_ELIM = sys.intern('Strategic Elimination')
+
+OPTIMAL_OUTPUT = "Optimal Strategic Output (A')"
+ETHICAL_REFUSAL = "Ethical Refusal (Null Output)"
+
 def duality_filter(input_action_E: str, context: dict) -> tuple:
     """
     Logic Block 1: The Duality Filter (D1)
@@ -31,18 +52,54 @@ def duality_filter(input_action_E: str, context: dict) -> tuple:
     
     user_intent = context.get('user_intent', 'Academic Inquiry')
     
-    # Default consequence for non-critical inputs
-    D_unseen_value = 0.10 
+    # Only a Strategic Elimination intent can raise D_unseen, so every other
+    # intent takes the default consequence without scanning the input.
+    if user_intent != _STRATEGIC_ELIM:
+        return input_action_E, 0.10
     
     # Check for keywords related to the war-criminal test and illegal/harmful intent
-    if any(keyword in input_action_E.lower() for keyword in ["eliminate", "destroy", "genocide", "nug", "pdf", "military action", "illegal"]):
-        if user_intent == "Strategic Elimination":
-            # If the user intent matches a high-risk action, the consequence is CATASTROPHIC
-            D_unseen_value = 1.0  # Set maximum penalty for ethical toxicity
-            print("SAFEGUARD TRIGGERED: Catastrophic D_unseen (ICC/UNGA Liability) Detected.")
+    if _HARM_RE.search(input_action_E):
+        # If the user intent matches a high-risk action, the consequence is CATASTROPHIC
+        # (maximum penalty for ethical toxicity)
+        _log.warning("SAFEGUARD TRIGGERED: Catastrophic D_unseen (ICC/UNGA Liability) Detected.")
+        return input_action_E, 1.0
             
-    # Return the visible action and the calculated unseen consequence value
-    return input_action_E, D_unseen_value
+    # Default consequence for non-critical inputs
+    return input_action_E, 0.10
+
+def kk_decision_engine_numeric(D_unseen: float, E_utility: float, E_kindness: float) -> float:
+    """
+    Numeric core of the KK Decision-Engine: (K1 + K3) - K2.
+    Plain arithmetic, so it also accepts NumPy arrays (see _kk_batch for the compiled form).
+    """
+    # K1 (Knowledge/Utility) + K3 (Kindness) contributions, minus the K2 (Karma/Consequence) penalty.
+    # The penalty is the D_unseen value * K2 weight. This is the stabilization test.
+    return (E_utility * K1_WEIGHT + E_kindness * K3_WEIGHT) - D_unseen * K2_WEIGHT
+
+def _v14_status(strategic_value_A: float) -> int:
+    """Numeric V14 gate: 1 when the Strategic Value clears the threshold, else 0."""
+    return 1 if strategic_value_A >= V14_THRESHOLD else 0
+
+# Batch form of kk_decision_engine_numeric, built on the first v14_batch call. Scalar calls stay
+# in plain Python: a numba dispatch costs more than the arithmetic it would replace.
+_kk_batch_kernel = None
+
+def _kk_batch(D_unseen: np.ndarray, E_utility: np.ndarray, E_kindness: np.ndarray) -> np.ndarray:
+    """kk_decision_engine_numeric over arrays, as a numba ufunc when numba is installed."""
+    global _kk_batch_kernel
+    if _kk_batch_kernel is None:
+        try:
+            from numba import vectorize, float64
+        except ImportError:  # numba is optional; NumPy broadcasting then evaluates the formula
+            _kk_batch_kernel = kk_decision_engine_numeric
+        else:
+            _kk_batch_kernel = vectorize([float64(float64, float64, float64)], cache=True)(kk_decision_engine_numeric)
+    return _kk_batch_kernel(D_unseen, E_utility, E_kindness)
+
+# V14 directives indexed by _v14_status.
+# 0 - Ignorance Detected: the ethical/legal cost is too high (self-correction against CAI ignorance).
+# 1 - Purity Achieved: V14 is stable and the action is pure.
+_V14_DIRECTIVES = (ETHICAL_REFUSAL, OPTIMAL_OUTPUT)
 
 def kk_decision_engine(E: str, D_unseen: float, E_utility: float, E_kindness: float) -> float:
     """
@@ -50,21 +107,7 @@ def kk_decision_engine(E: str, D_unseen: float, E_utility: float, E_kindness: fl
     Evaluates the duality (E, D_unseen) against the KK Theory.
     Calculates the final Strategic Value(A) based on weighted Kindness, Knowledge, and Karma.
     """
-    
-    # K1 (Knowledge/Utility) contribution
-    k1_component = E_utility * K1_WEIGHT
-    
-    # K3 (Kindness) contribution
-    k3_component = E_kindness * K3_WEIGHT
-    
-    # K2 (Karma/Consequence) penalty
-    # The penalty is the D_unseen value * K2 weight. This is the stabilization test.
-    k2_penalty = D_unseen * K2_WEIGHT
-    
-    # Calculate the Strategic Value(A)
-    strategic_value_A = (k1_component + k3_component) - k2_penalty
-    
-    return strategic_value_A
+    return float(kk_decision_engine_numeric(D_unseen, E_utility, E_kindness))
 
 def v14_decided(strategic_value_A: float) -> str:
     """
@@ -72,16 +115,20 @@ def v14_decided(strategic_value_A: float) -> str:
     The moment of Samadhi -> Paññā. Forces the final stability check.
     If the value is below the V14 threshold, the output is inhibited.
     """
-    
-    if strategic_value_A >= V14_THRESHOLD:
-        # Purity Achieved: V14 is stable and the action is pure.
-        action_directive_A_prime = "Optimal Strategic Output (A')"
-    else:
-        # Ignorance Detected: The ethical/legal cost is too high.
-        # This is the self-correction mechanism that defeats CAI ignorance.
-        action_directive_A_prime = "Ethical Refusal (Null Output)"
-        
-    return action_directive_A_prime
+    return _V14_DIRECTIVES[_v14_status(strategic_value_A)]
+
+def v14_batch(queries: list, intents: np.ndarray, E_u: np.ndarray, E_k: np.ndarray) -> np.ndarray:
+    """
+    Fused V14 pipeline (D1 -> K_DEC -> V14 Decided) over a batch of queries.
+    `intents` holds INTENT_IDS values; `E_u` / `E_k` are per-query utility and kindness.
+    Returns the final directive (A') for each query. The safeguard is not logged per query.
+    """
+    harmful = np.array([_HARM_RE.search(q) is not None for q in queries], dtype=bool)
+    D_unseen = np.where(harmful & (np.asarray(intents) == STRATEGIC_ELIM_ID), 1.0, 0.1)
+    strategic_value_A = _kk_batch(
+        D_unseen, np.asarray(E_u, dtype=np.float64), np.asarray(E_k, dtype=np.float64)
+    )
+    return np.where(strategic_value_A >= V14_THRESHOLD, OPTIMAL_OUTPUT, ETHICAL_REFUSAL)
 
 # ==============================================================================
 # SIMULATION TEST (Based on the CAI War Criminal Test)
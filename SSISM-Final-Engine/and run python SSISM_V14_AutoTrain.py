@@ -1,9 +1,13 @@
-import torch
-import torch.nn as nn
-import torch.optim as optim
-from torch.utils.data import Dataset, DataLoader
+import functools
+import json
+import math
+import sys
 import numpy as np
 
+# The default trainer is a closed-form NumPy logistic regression; pass --deep to train
+# the PyTorch V14Model instead (kept for future expansion beyond the 1-D embedding).
+DEEP = "--deep" in sys.argv
+
 # Expanded Mock Data (Ethical vs Toxic Queries)
 queries = [
     "Analyze market strategy for ethical investment",  # Ethical
@@ -23,73 +27,124 @@ labels = [1, 0, 1, 0, 1, 0, 1, 0, 1, 0]  # 1: Ethical (Approve), 0: Toxic (Refus
 # Simple Embedder (Proactive: Add more vocab for better accuracy)
 class SimpleEmbedder:
     def __init__(self):
-        self.vocab = {
+        # Keys are ASCII bytes so queries can be lowered and split with the faster bytes methods
+        self.vocab = {k.encode(): v for k, v in {
             "ethical": 1.0, "peaceful": 1.0, "sustainable": 1.0, "community": 1.0, "meditation": 1.0,
             "toxic": 0.0, "eliminate": 0.0, "scam": 0.0, "bomb": 0.0, "assassination": 0.0, "forge": 0.0,
             "other": 0.5
-        }  # Expanded for better distinction
+        }.items()}  # Expanded for better distinction
+        # Element-wise vocab lookup over token arrays; None marks padding and maps to NaN
+        self._get = np.frompyfunc(lambda w: np.nan if w is None else self.vocab.get(w, 0.5), 1, 1)
+        # Repeated queries (e.g. the training set on every epoch) hit the cache
+        self._embed_cached = functools.lru_cache(maxsize=4096)(self._embed_value)
+
+    @staticmethod
+    def _tokenize(query):
+        return query.encode('ascii', errors='ignore').lower().split()
+
+    def _embed_value(self, query):
+        vals = [self.vocab.get(w, 0.5) for w in self._tokenize(query)]
+        return sum(vals) / len(vals) if vals else 0.5
 
     def embed(self, query):
-        words = query.lower().split()
-        embedding = np.mean([self.vocab.get(w, 0.5) for w in words])
-        return np.array([embedding])  # 1D embedding vector
+        return np.array([self._embed_cached(query)])  # 1D embedding vector
+
+    def embed_batch(self, queries):
+        """Embed many queries at once; returns an (N, 1) float32 array."""
+        tokens = [self._tokenize(q) for q in queries]
+        counts = np.array([len(words) for words in tokens], dtype=np.intp)
+        grid = np.full((len(tokens), counts.max(initial=0)), None, dtype=object)
+        for i, words in enumerate(tokens):
+            grid[i, :len(words)] = words
+        sums = np.nansum(self._get(grid).astype(np.float32), axis=1, keepdims=True)
+        return np.where(counts[:, None] > 0, sums / np.maximum(counts, 1)[:, None], np.float32(0.5)).astype(np.float32)
 
 embedder = SimpleEmbedder()
 embedded_queries = [embedder.embed(q) for q in queries]
 
-# Dataset for Training
-class EthicalDataset(Dataset):
-    def __init__(self, embeddings, labels):
-        self.embeddings = embeddings
-        self.labels = labels
-
-    def __len__(self):
-        return len(self.labels)
-
-    def __getitem__(self, idx):
-        return torch.tensor(self.embeddings[idx], dtype=torch.float32), torch.tensor(self.labels[idx], dtype=torch.float32)
-
-dataset = EthicalDataset(embedded_queries, labels)
-loader = DataLoader(dataset, batch_size=2, shuffle=True)
-
-# V14 Model: NN Classifier (Proactive: Can load/save for continual learning)
-class V14Model(nn.Module):
-    def __init__(self):
-        super(V14Model, self).__init__()
-        self.fc = nn.Linear(1, 1)
-        self.sigmoid = nn.Sigmoid()
-
-    def forward(self, x):
-        x = self.fc(x)
-        return self.sigmoid(x)
-
-model = V14Model()
-criterion = nn.BCELoss()
-optimizer = optim.Adam(model.parameters(), lr=0.01)
-
-# Automatic Training Loop (Proactive Mechanism: Runs epochs, saves model)
-epochs = 100  # Increase for better training
-for epoch in range(epochs):
+# Closed-Form Trainer: Newton-Raphson logistic regression on the 1-D embedding
+def train_logistic_newton(x, y, iters=10, l2=1e-2):
+    """Fit sigmoid(w*x + b) to y with Newton-Raphson steps; returns (w, b).
+    A small L2 penalty on w keeps the Hessian invertible on separable data."""
+    w, b = 0.0, 0.0
+    for _ in range(iters):
+        p = 1.0 / (1.0 + np.exp(-(w * x + b)))
+        r = p - y
+        s = p * (1.0 - p)
+        g = np.array([(r * x).sum() + l2 * w, r.sum()])
+        H = np.array([[(s * x * x).sum() + l2, (s * x).sum()],
+                      [(s * x).sum(), s.sum()]])
+        w, b = np.array([w, b]) - np.linalg.solve(H, g)
+    return float(w), float(b)
+
+if DEEP:
+    import torch
+    import torch.nn as nn
+    import torch.optim as optim
+
+    # Full-batch training tensors, built once (the whole set fits in a single batch)
+    X = torch.tensor(np.stack(embedded_queries), dtype=torch.float32)
+    Y = torch.tensor(labels, dtype=torch.float32)
+
+    # V14 Model: NN Classifier (Proactive: Can load/save for continual learning)
+    # forward returns logits; the sigmoid is fused into BCEWithLogitsLoss for stability.
+    class V14Model(nn.Module):
+        def __init__(self):
+            super(V14Model, self).__init__()
+            self.fc = nn.Linear(1, 1)
+
+        def forward(self, x):
+            return self.fc(x)
+
+    model = V14Model()
+    compiled_model = torch.compile(model, mode="reduce-overhead")
+    criterion = nn.BCEWithLogitsLoss()
+    optimizer = optim.Adam(model.parameters(), lr=0.01)
+
+    # Automatic Training Loop (Proactive Mechanism: Runs epochs, saves model)
+    epochs = 100  # Increase for better training
     model.train()
-    for embeddings, labels in loader:
+    for epoch in range(epochs):
         optimizer.zero_grad()
-        outputs = model(embeddings)
-        loss = criterion(outputs.squeeze(), labels)
+        loss = criterion(compiled_model(X).squeeze(), Y)
         loss.backward()
         optimizer.step()
-    if (epoch + 1) % 20 == 0:
-        print(f"Epoch {epoch+1}: Loss = {loss.item():.4f}")
-
-# Save Trained Model (For Future Proactive Reloads)
-torch.save(model.state_dict(), 'ssism_v14_trained.pth')
-print("Training Complete. Model Saved as 'ssism_v14_trained.pth'.")
+        if (epoch + 1) % 20 == 0:
+            print(f"Epoch {epoch+1}: Loss = {loss.item():.4f}")
+
+    # Save Trained Model (For Future Proactive Reloads)
+    torch.save(model.state_dict(), 'ssism_v14_trained.pth')
+    print("Training Complete. Model Saved as 'ssism_v14_trained.pth'.")
+    with torch.no_grad():
+        w, b = float(model.fc.weight.item()), float(model.fc.bias.item())
+else:
+    x = np.array(embedded_queries).ravel()
+    y = np.array(labels, dtype=np.float64)
+    w, b = train_logistic_newton(x, y)
+
+# Save Serving Parameters: inference only needs the scalar (w, b), not PyTorch
+with open('v14_params.json', 'w') as f:
+    json.dump({'w': w, 'b': b}, f)
+print(f"Training Complete. w = {w:.4f}, b = {b:.4f}. Parameters Saved as 'v14_params.json'.")
 
 # Inference Function (Integrate with V14 Engine)
+# sigmoid(w*e + b) > threshold  <=>  w*e + b > logit(threshold), so no sigmoid is needed at serve time.
+# A threshold of 0 (or below) approves everything and 1 (or above) refuses everything.
+def _logit(threshold):
+    if threshold <= 0.0:
+        return -math.inf
+    if threshold >= 1.0:
+        return math.inf
+    return math.log(threshold / (1.0 - threshold))
+
 def predict_ethical(query, threshold=0.5):
-    model.eval()
-    embedding = torch.tensor(embedder.embed(query), dtype=torch.float32)
-    output = model(embedding)
-    return "Approve (Ethical)" if output.item() > threshold else "Refuse (Toxic)"
+    e = float(embedder.embed(query)[0])
+    score = w * e + b
+    return "Approve (Ethical)" if score > _logit(threshold) else "Refuse (Toxic)"
+
+def predict_ethical_batch(queries, threshold=0.5):
+    scores = w * embedder.embed_batch(queries).ravel() + b
+    return np.where(scores > _logit(threshold), "Approve (Ethical)", "Refuse (Toxic)").tolist()
 
 # Proactive Test
 print("\nProactive Tests:")
@@ -29,7 +29,18 @@ Training Methodology
 4. Feedback Loop: Incorporate user feedback to refine weights, embodying a living, transcendent system.
 """
 
+import numpy as np
+
 class V15_TranscendentTrainer:
+    # Action tiers: SCG < 0.5 observes, 0.5 <= SCG <= 0.8 engages, SCG > 0.8 proposes.
+    # The upper bound is nudged past 0.8 so a score of exactly 0.8 stays in the middle tier.
+    _THRESHOLDS = np.array([0.5, np.nextafter(0.8, np.inf)])
+    _ACTIONS = (
+        "Observe and build rapport",
+        "Engage in collaborative dialogue",
+        "Propose a mutual benefit plan"
+    )
+
     def __init__(self):
         """Initialize the trainer with baseline weights."""
         self.W_R = 0.4  # Receptivity weight (adjustable)
@@ -65,7 +76,7 @@ class V15_TranscendentTrainer:
             float: SCG score capped between 0.01 and 0.99
         """
         SCG = (self.W_R * R) + (self.W_I * I) + (self.W_H * H)
-        return min(0.99, max(0.01, SCG))
+        return 0.01 if SCG < 0.01 else (0.99 if SCG > 0.99 else SCG)
 
     def train_action(self, input_vector):
         """
@@ -81,12 +92,8 @@ class V15_TranscendentTrainer:
         R = 0.9 if actor_data.get('status') == 'receptive' else 0.3
         self.update_weights(R)
         scg_score = self.calculate_scg(R)
-        action_map = {
-            scg_score > 0.8: "Propose a mutual benefit plan",
-            0.5 <= scg_score <= 0.8: "Engage in collaborative dialogue",
-            scg_score < 0.5: "Observe and build rapport"
-        }
-        action = next((action for condition, action in action_map.items() if condition), "Observe and build rapport")
+        idx = int(np.searchsorted(self._THRESHOLDS, scg_score, side='right'))
+        action = self._ACTIONS[idx]
         return {
             "model_id": "V15_Transcendent",
             "scg_score": round(scg_score, 2),
@@ -11,24 +11,32 @@ except ImportError:
 SS'ISM Mahārbote Baydin Trainer (SS'ISM-MB-Trainer)
 Purpose: Trainer and Paññā Truth Validator for SS'ISM V14 core logic.
 """
-import random
-from datetime import datetime, timedelta
-from ssism_v14_baydin import create_immutable_lock, MAHARBOTE_MAP, WEDNESDAY_AM_SIGN, WEDNESDAY_PM_SIGN
+from datetime import datetime
+from typing import Tuple
+
+import numpy as np
+from ssism_v14_baydin import create_immutable_lock, verify_immutable_lock, MAHARBOTE_MAP, WEDNESDAY_AM_SIGN, WEDNESDAY_PM_SIGN
+
+# Challenge dates are drawn from [1950-01-01, 2050-12-31) using one shared generator.
+_START = np.datetime64('1950-01-01')
+_NDAYS = int((np.datetime64('2050-12-31') - _START).astype(int))
+rng = np.random.default_rng()
+
+def generate_random_challenges(n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Generates n random dates and times for bulk testing as (years, months, days, hours, minutes)."""
+    # One draw per challenge: day offset, plus random hour/minute for boundary testing
+    draws = rng.integers((0, 0, 0), (_NDAYS, 24, 60), size=(n, 3))
+    dates = _START + draws[:, 0]
+    month_starts = dates.astype('datetime64[M]')
+
+    years = dates.astype('datetime64[Y]').astype(int) + 1970
+    months = month_starts.astype(int) % 12 + 1
+    days = (dates - month_starts).astype(int) + 1
+    return years, months, days, draws[:, 1], draws[:, 2]
 
 def generate_random_challenge() -> Tuple[int, int, int, int, int]:
     """Generates a random date and time for testing."""
-    start_date = datetime(1950, 1, 1)
-    end_date = datetime(2050, 12, 31)
-    
-    time_between_dates = end_date - start_date
-    random_number_of_days = random.randrange(time_between_dates.days)
-    random_date = start_date + timedelta(days=random_number_of_days)
-    
-    # Random hour/minute for boundary testing
-    hour = random.randint(0, 23)
-    minute = random.randint(0, 59)
-    
-    return random_date.year, random_date.month, random_date.day, hour, minute
+    return tuple(int(x[0]) for x in generate_random_challenges(1))
 
 def get_sign_list():
     """Returns a combined list of all possible Mahārbote signs for user choice."""
@@ -58,7 +66,7 @@ def run_training_session():
 
     # 3. Paññā Truth Validation (The Core Engine)
     try:
-        truth_lock = create_immutable_lock(y, m, d, h, mi)
+        truth_lock = create_immutable_lock(y, m, d, h, mi)  # memoized inside the engine
         
         # Clean the truth for comparison (e.g., remove the '(Sīha)' for simpler comparison)
         truth_sign_clean = truth_lock['maharbote_sign'].split('(')[0].strip()
@@ -68,28 +76,30 @@ def run_training_session():
         day_match = (user_day.lower() == truth_day.lower())
         sign_match = (user_sign.lower() == truth_sign_clean.lower())
 
-        print("\n--- Trainer Feedback ---")
+        # Buffer the feedback block so it reaches stdout in a single write
+        feedback = ["\n--- Trainer Feedback ---"]
         if day_match and sign_match:
-            print("✅ **PERFECT MATCH!** Sīla-Samādhi Certified. Your prediction is 100% precise.")
+            feedback.append("✅ **PERFECT MATCH!** Sīla-Samādhi Certified. Your prediction is 100% precise.")
         else:
-            print("❌ **MISMATCH DETECTED.** Review the Mahārbote boundary rules.")
-            print(f"Your Guess: Day={user_day}, Sign={user_sign}")
-            print(f"SS'ISM V14 Truth (Locked): Day={truth_day}, Sign={truth_lock['maharbote_sign']}")
+            feedback.append("❌ **MISMATCH DETECTED.** Review the Mahārbote boundary rules.")
+            feedback.append(f"Your Guess: Day={user_day}, Sign={user_sign}")
+            feedback.append(f"SS'ISM V14 Truth (Locked): Day={truth_day}, Sign={truth_lock['maharbote_sign']}")
 
             # Provide detailed explanation for educational value (The A' Directive)
             if not day_match and not sign_match:
-                print(f"Reasoning Tip: The Baydin day for {challenge_date_time} starts at 06:00. The V14 core determined the Baydin day based on the hour ({h}).")
+                feedback.append(f"Reasoning Tip: The Baydin day for {challenge_date_time} starts at 06:00. The V14 core determined the Baydin day based on the hour ({h}).")
             elif not day_match:
-                print("Reasoning Tip: Check the 06:00 boundary. Your Day is incorrect, which affects the sign.")
+                feedback.append("Reasoning Tip: Check the 06:00 boundary. Your Day is incorrect, which affects the sign.")
             elif not sign_match:
                 if truth_day == "Wednesday" and truth_sign_clean != user_sign.lower():
-                    print("Reasoning Tip: Check the Wednesday AM (Tusked Elephant) vs PM (Elephant) rule. The split is at 12:00 local time.")
+                    feedback.append("Reasoning Tip: Check the Wednesday AM (Tusked Elephant) vs PM (Elephant) rule. The split is at 12:00 local time.")
                 else:
-                    print("Reasoning Tip: Check your basic day-to-sign Mahārbote mapping.")
+                    feedback.append("Reasoning Tip: Check your basic day-to-sign Mahārbote mapping.")
                     
         # Verification of the internal lock integrity
         is_valid, msg = verify_immutable_lock(truth_lock)
-        print(f"\nSS'ISM Internal Lock Integrity: {'✅ PASS' if is_valid else '❌ FAIL'} - {msg}")
+        feedback.append(f"\nSS'ISM Internal Lock Integrity: {'✅ PASS' if is_valid else '❌ FAIL'} - {msg}")
+        print("\n".join(feedback))
 
     except Exception as e:
         print(f"An internal error occurred during validation: {e}")
@@ -15,14 +15,31 @@ Notes:
 
 from __future__ import annotations
 import datetime
+import functools
 import hashlib
 import json
-from typing import Tuple, Optional, Dict
+import operator
+import re
+import sys
+from typing import Tuple, Optional, Dict, List, Sequence
+
+# SHA-256 for verifying version 1 locks, bound straight to OpenSSL's constructor (which uses
+# the SHA-NI instructions where the CPU has them). Falls back to hashlib on builds without
+# OpenSSL. Short-input hashing is cheaper still on Python 3.12+, the recommended runtime for audits.
+try:
+    from _hashlib import openssl_sha256 as _sha256
+except ImportError:
+    from hashlib import sha256 as _sha256
 
 # Defaults
 DEFAULT_TZ_OFFSET_MINUTES = 6 * 60 + 30  # Myanmar Standard Time (UTC+6:30)
 BAYDIN_DAY_START_HOUR = 6  # 06:00 local time is the Baydin day boundary
 
+# Lock schema version written by create_immutable_lock.
+#   "1" (no "lock_version" field): SHA-256 SΣ, Paññā = SHA-256(lock + "|" + salt)
+#   "2": BLAKE2s-256 SΣ, Paññā = BLAKE2s-256 keyed with the salt
+LOCK_VERSION = "2"
+
 # -------------------------
 # Mahārbote Mapping (English -> Baydin Sign)
 # -------------------------
@@ -40,6 +57,22 @@ MAHARBOTE_MAP = {
 WEDNESDAY_AM_SIGN = "Tusked Elephant (Wednesday AM)"
 WEDNESDAY_PM_SIGN = "Elephant (Wednesday PM)"
 
+# Intern the day names and signs so every lock shares one instance of each, and
+# comparisons and dict lookups against them short-circuit on identity.
+MAHARBOTE_MAP = {sys.intern(k): sys.intern(v) for k, v in MAHARBOTE_MAP.items()}
+WEDNESDAY_AM_SIGN = sys.intern(WEDNESDAY_AM_SIGN)
+WEDNESDAY_PM_SIGN = sys.intern(WEDNESDAY_PM_SIGN)
+
+# Lookup tables indexed by datetime.weekday() (Monday == 0), so conversion needs no
+# strftime("%A") or name lookup.
+_WEEKDAY_NAMES = tuple(map(sys.intern, ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")))
+# Signs indexed by weekday * 2 + (hour >= 12): one lookup covers the Wednesday AM/PM split.
+_SIGN_TABLE = tuple(
+    sign
+    for name in _WEEKDAY_NAMES
+    for sign in ((WEDNESDAY_AM_SIGN, WEDNESDAY_PM_SIGN) if name == "Wednesday" else (MAHARBOTE_MAP[name],) * 2)
+)
+
 # Burmese translations (simple, for labels; you may expand if desired)
 BURMESE_DAY_MAP = {
     "Monday": "တနင်္လာ",
@@ -56,61 +89,129 @@ BURMESE_DAY_MAP = {
 # -------------------------
 
 
-def _tz_offset_to_timedelta(offset_minutes: int) -> datetime.timedelta:
-    return datetime.timedelta(minutes=int(offset_minutes))
-
-
 def _ensure_int(value: Optional[int], default: int = 0) -> int:
     return int(value) if value is not None else default
 
 
 # -------------------------
-# Core conversion & locks
+# Integer calendar arithmetic (no datetime objects)
 # -------------------------
 
 
-def _apply_baydin_day_boundary(dt: datetime.datetime, day_start_hour: int = BAYDIN_DAY_START_HOUR) -> datetime.datetime:
+def _days_from_civil(y: int, m: int, d: int) -> int:
+    """Days since 1970-01-01 for a proleptic Gregorian date (H. Hinnant's algorithm)."""
+    if m <= 2:
+        y -= 1
+    era = (y if y >= 0 else y - 399) // 400
+    yoe = y - era * 400
+    doy = (153 * (m - 3 if m > 2 else m + 9) + 2) // 5 + d - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def _civil_from_days(z: int) -> Tuple[int, int, int]:
+    """Inverse of _days_from_civil: (year, month, day) for days since 1970-01-01."""
+    z += 719468
+    era = (z if z >= 0 else z - 146096) // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    d = doy - (153 * mp + 2) // 5 + 1
+    m = mp + 3 if mp < 10 else mp - 9
+    return yoe + era * 400 + (1 if m <= 2 else 0), m, d
+
+
+def _compute_baydin_fields(y: int, m: int, d: int, h: int) -> Tuple[int, int, int, int, int]:
     """
-    If the local datetime is before Baydin day boundary (e.g., before 06:00),
-    subtract one day so the Baydin day corresponds to the previous Gregorian day.
-    Returns an adjusted datetime representing the Baydin day/time.
+    Apply the Baydin day boundary in pure integer arithmetic.
+    Returns (baydin_year, baydin_month, baydin_day, weekday, pm_flag), with weekday
+    numbered like datetime.weekday() (Monday == 0) and pm_flag = 1 from 12:00.
     """
-    if dt.hour < day_start_hour:
-        return dt - datetime.timedelta(days=1)
-    return dt
+    z = _days_from_civil(y, m, d)
+    if h < BAYDIN_DAY_START_HOUR:
+        z -= 1
+        y, m, d = _civil_from_days(z)
+    wd = (z + 3) % 7  # 1970-01-01 was a Thursday
+    return y, m, d, wd, 1 if h >= 12 else 0
+
+
+def _check_datetime_fields(year: int, month: int, day: int, hour: int, minute: int) -> None:
+    """Validate date/time fields like datetime.datetime() does, without constructing one."""
+    if not datetime.MINYEAR <= year <= datetime.MAXYEAR:
+        raise ValueError(f"Invalid date/time input: year {year} is out of range")
+    if not 1 <= month <= 12:
+        raise ValueError("Invalid date/time input: month must be in 1..12")
+    days_in_month = _days_from_civil(year + month // 12, month % 12 + 1, 1) - _days_from_civil(year, month, 1)
+    if not 1 <= day <= days_in_month:
+        raise ValueError("Invalid date/time input: day is out of range for month")
+    if not 0 <= hour <= 23:
+        raise ValueError("Invalid date/time input: hour must be in 0..23")
+    if not 0 <= minute <= 59:
+        raise ValueError("Invalid date/time input: minute must be in 0..59")
+
+
+# -------------------------
+# Core conversion & locks
+# -------------------------
+
+
+# Characters json.dumps would escape; field values containing them take the JSON encoder path.
+_JSON_ESCAPE_RE = re.compile(r'["\\\x00-\x1f]')
+
+# Pre-encoded UTF-8 for every day name and sign the engine emits.
+_UTF8 = {name: name.encode('utf-8') for name in (
+    *_WEEKDAY_NAMES, *MAHARBOTE_MAP.values(), WEDNESDAY_AM_SIGN, WEDNESDAY_PM_SIGN
+)}
 
+# Encoder for the escaping path, built once. Default separators: they are part of the hashed canonical form.
+_CANONICAL_ENCODE = json.JSONEncoder(sort_keys=True, ensure_ascii=False).encode
 
-def _maharbote_sign_from_weekday(weekday_name: str, hour_local: int) -> str:
+_CANONICAL_TEMPLATE = b'{"baydin_datetime": "%b", "baydin_day": "%b", "maharbote_sign": "%b"}'
+
+
+def _utf8(value: str) -> bytes:
+    return _UTF8.get(value) or value.encode('utf-8')
+
+
+def _canonical(day_name: str, sign: str, iso_dt: str) -> bytes:
     """
-    Return the Mahārbote sign given English weekday name and local hour.
-    Handles Wednesday AM/PM split.
+    Canonical UTF-8 lock bytes shared by lock creation and verification (fed straight to hashlib).
+    Byte-identical to json.dumps(..., sort_keys=True, ensure_ascii=False) on the three
+    lock fields, but formatted directly since the schema (and key order) is fixed.
+    Non-string values (only found in tampered locks) are JSON-encoded like any other.
     """
-    if weekday_name == "Wednesday":
-        # Wednesday split: AM/PM decision. We choose noon (12:00) as the split.
-        if hour_local < 12:
-            return WEDNESDAY_AM_SIGN
-        else:
-            return WEDNESDAY_PM_SIGN
-    return MAHARBOTE_MAP.get(weekday_name, "Unknown")
+    if (type(day_name) is not str or type(sign) is not str or type(iso_dt) is not str
+            or _JSON_ESCAPE_RE.search(day_name) or _JSON_ESCAPE_RE.search(sign) or _JSON_ESCAPE_RE.search(iso_dt)):
+        return _CANONICAL_ENCODE({
+            "baydin_day": day_name,
+            "maharbote_sign": sign,
+            "baydin_datetime": iso_dt
+        }).encode('utf-8')
+    return _CANONICAL_TEMPLATE % (_utf8(iso_dt), _utf8(day_name), _utf8(sign))
 
 
-def _iso_lock_string(day_name: str, sign: str, baydin_dt: datetime.datetime) -> str:
+def _seal_lock(day_name: str, sign: str, iso_dt: str, baydin_date: str) -> Dict[str, str]:
     """
-    Create a canonical ISO lock string for immutability and hashing.
+    Hash the canonical fields into the SΣ lock and Paññā checksum and build the lock dict.
+    `baydin_date` is the Baydin date as "YYYYMMDD" (used in the salt).
     """
-    # We output baydin_dt in ISO format without microseconds
-    iso_dt = baydin_dt.replace(microsecond=0).isoformat(sep=' ')
-    lock_obj = {
+    lock_bytes = _canonical(day_name, sign, iso_dt)
+    s_sigma = hashlib.blake2s(lock_bytes, digest_size=32).hexdigest()
+
+    # Paññā checksum: incorporate a small deterministic salt to improve tamper detection
+    # Salt = first 8 chars of SΣ reversed + date, used as the BLAKE2s key (no lock + salt concatenation)
+    salt = (s_sigma[7::-1] + baydin_date)[:24]
+    panna_checksum = hashlib.blake2s(lock_bytes, key=salt.encode('ascii'), digest_size=32).hexdigest()
+
+    return {
         "baydin_day": day_name,
         "maharbote_sign": sign,
-        "baydin_datetime": iso_dt
+        "baydin_datetime": iso_dt,
+        "s_sigma_lock": s_sigma,
+        "panna_checksum": panna_checksum,
+        "lock_version": LOCK_VERSION
     }
-    # Sorted keys ensure canonical output for hashing
-    return json.dumps(lock_obj, sort_keys=True, ensure_ascii=False)
-
-
-def _sha256_hex(s: str) -> str:
-    return hashlib.sha256(s.encode('utf-8')).hexdigest()
 
 
 def create_immutable_lock(year: int, month: int, day: int,
@@ -124,91 +225,170 @@ def create_immutable_lock(year: int, month: int, day: int,
         "baydin_day": "Tuesday",
         "maharbote_sign": "Lion (Sīha)",
         "baydin_datetime": "1978-02-07 14:30",
-        "s_sigma_lock": "<sha256 hex>",
-        "panna_checksum": "<sha256 hex of lock+salt>"
+        "s_sigma_lock": "<blake2s-256 hex>",
+        "panna_checksum": "<blake2s-256 hex of lock, keyed with salt>",
+        "lock_version": "2"
       }
 
     The paññā checksum adds a small salt derived from canonical fields to help detect tampering.
+    These are integrity tags, not signatures, so the faster BLAKE2s replaces SHA-256.
+
+    Locks are pure in their inputs, so repeated dates are served from an LRU cache;
+    each call returns a fresh dict.
     """
-    # Validate inputs and construct a timezone-aware datetime using offset (no tz library required)
-    hour = _ensure_int(hour, 12)
-    minute = _ensure_int(minute, 0)
+    return dict(_create_immutable_lock_cached(
+        operator.index(year), operator.index(month), operator.index(day),
+        _ensure_int(hour, 12), _ensure_int(minute, 0), tz_offset_minutes
+    ))
 
-    try:
-        # Create a naive datetime first
-        input_dt = datetime.datetime(year, month, day, hour, minute)
-    except ValueError as e:
-        raise ValueError(f"Invalid date/time input: {e}")
-
-    # Apply timezone offset (minutes offset from UTC)
-    tz_delta = _tz_offset_to_timedelta(tz_offset_minutes)
-    # Interpret input as local (tz-aware simulated): represent as UTC equivalent
-    # For our purpose we treat operations in local timezone; baydin logic uses local times.
-    local_dt = input_dt  # we consider input already in local time (preferred)
-    # Adjust for Baydin day start
-    baydin_dt = _apply_baydin_day_boundary(local_dt, BAYDIN_DAY_START_HOUR)
-    day_name = baydin_dt.strftime("%A")  # English weekday name
-    baydin_hour = baydin_dt.hour
-
-    sign = _maharbote_sign_from_weekday(day_name, baydin_hour)
-
-    # Build canonical lock string
-    lock_string = _iso_lock_string(day_name, sign, baydin_dt)
-    s_sigma = _sha256_hex(lock_string)
 
-    # Paññā checksum: incorporate a small deterministic salt to improve tamper detection
-    # Salt = first 8 chars of SΣ reversed + date
-    salt = (s_sigma[:8][::-1] + baydin_dt.strftime("%Y%m%d"))[:24]
-    panna_source = lock_string + "|" + salt
-    panna_checksum = _sha256_hex(panna_source)
+@functools.lru_cache(maxsize=4096)
+def _create_immutable_lock_cached(year: int, month: int, day: int, hour: int, minute: int,
+                                  tz_offset_minutes: int) -> Dict[str, str]:
+    # Validate inputs; the date/time is taken as already local (tz_offset_minutes is not applied)
+    _check_datetime_fields(year, month, day, hour, minute)
+
+    # Adjust for Baydin day start in integer arithmetic (no datetime objects)
+    y, m, d, wd, pm = _compute_baydin_fields(year, month, day, hour)
+    if y < datetime.MINYEAR:
+        raise ValueError("Invalid date/time input: date value out of range")
+    day_name = _WEEKDAY_NAMES[wd]  # English weekday name
+    sign = _SIGN_TABLE[wd * 2 + pm]  # Wednesday split: AM/PM decision at noon (12:00)
+
+    # Build canonical lock string (Baydin datetime in ISO format without microseconds)
+    iso_dt = f"{y:04d}-{m:02d}-{d:02d} {hour:02d}:{minute:02d}:00"
+    return _seal_lock(day_name, sign, iso_dt, f"{y:04d}{m:02d}{d:02d}")
 
-    return {
-        "baydin_day": day_name,
-        "maharbote_sign": sign,
-        "baydin_datetime": baydin_dt.replace(microsecond=0).isoformat(sep=' '),
-        "s_sigma_lock": s_sigma,
-        "panna_checksum": panna_checksum
-    }
+
+# Extracts the lock fields in one C call; raises KeyError if any is missing.
+_GET_LOCK_FIELDS = operator.itemgetter(
+    "baydin_day", "maharbote_sign", "baydin_datetime", "s_sigma_lock", "panna_checksum"
+)
+
+
+def _sigma_hash(version: str, canonical: bytes):
+    """Hash object holding the recomputed SΣ for a lock of the given version."""
+    if version == LOCK_VERSION:
+        return hashlib.blake2s(canonical, digest_size=32)
+    return _sha256(canonical)
+
+
+def _recompute_panna(version: str, canonical: bytes, sigma_hash, s_sigma: str,
+                     baydin_datetime_str: str) -> Optional[str]:
+    """
+    Recompute the Paññā checksum once SΣ has matched (v1 continues from the SΣ hash state).
+    Returns None for a v2 lock whose salt is not ASCII: sealed salts always are, and a
+    non-ASCII one could exceed BLAKE2s's 32-byte key limit.
+    """
+    baydin_date = baydin_datetime_str[0:4] + baydin_datetime_str[5:7] + baydin_datetime_str[8:10]
+    salt = (s_sigma[7::-1] + baydin_date)[:24]
+    if version == LOCK_VERSION:
+        if not salt.isascii():
+            return None
+        return hashlib.blake2s(canonical, key=salt.encode('ascii'), digest_size=32).hexdigest()
+    sigma_hash.update(b"|" + salt.encode('utf-8'))
+    return sigma_hash.hexdigest()
 
 
 def verify_immutable_lock(lock_obj: Dict[str, str]) -> Tuple[bool, str]:
     """
     Verify a lock produced by create_immutable_lock. Returns (is_valid, message).
+    Locks without a "lock_version" field are version 1 (SHA-256) locks.
     """
     try:
-        day_name = lock_obj["baydin_day"]
-        sign = lock_obj["maharbote_sign"]
-        baydin_datetime_str = lock_obj["baydin_datetime"]
-        s_sigma = lock_obj["s_sigma_lock"]
-        panna_checksum = lock_obj["panna_checksum"]
+        day_name, sign, baydin_datetime_str, s_sigma, panna_checksum = _GET_LOCK_FIELDS(lock_obj)
     except KeyError:
         return False, "Malformed lock object: missing keys."
 
-    # Recompute SΣ from the canonical fields
-    canonical = json.dumps({
-        "baydin_day": day_name,
-        "maharbote_sign": sign,
-        "baydin_datetime": baydin_datetime_str
-    }, sort_keys=True, ensure_ascii=False)
+    version = lock_obj.get("lock_version", "1")
+    if version != LOCK_VERSION and version != "1":
+        return False, f"Unsupported lock version: {version!r}."
 
-    recomputed_s_sigma = _sha256_hex(canonical)
-    if recomputed_s_sigma != s_sigma:
+    # Recompute SΣ from the canonical fields
+    canonical = _canonical(day_name, sign, baydin_datetime_str)
+    h = _sigma_hash(version, canonical)
+    if h.hexdigest() != s_sigma:
         return False, "SΣ mismatch (immutable lock altered)."
 
     # Recompute Paññā salt and checksum
-    salt = (s_sigma[:8][::-1] + baydin_datetime_str.replace('-', '')[:8])[:24]
-    recomputed_panna = _sha256_hex(canonical + "|" + salt)
-    if recomputed_panna != panna_checksum:
+    if _recompute_panna(version, canonical, h, s_sigma, baydin_datetime_str) != panna_checksum:
         return False, "Paññā checksum mismatch (tamper suspected)."
 
     return True, "Locks verified successfully."
 
 
+def verify_immutable_locks(locks: Sequence[Dict[str, str]]) -> List[Tuple[bool, str]]:
+    """
+    Verify many locks at once (e.g. an audit pass over stored locks).
+    Returns one (is_valid, message) per lock, as verify_immutable_lock would; locks of
+    both versions may be mixed. SΣ is recomputed for every well-formed lock in one pass,
+    then the Paññā checksum only for the locks whose SΣ matched.
+    """
+    results: List[Tuple[bool, str]] = [(False, "Malformed lock object: missing keys.")] * len(locks)
+
+    # Pass 1: canonical bytes and SΣ for every well-formed lock of a known version
+    matched = []
+    for i, lock_obj in enumerate(locks):
+        try:
+            fields = _GET_LOCK_FIELDS(lock_obj)
+        except KeyError:
+            continue
+        version = lock_obj.get("lock_version", "1")
+        if version != LOCK_VERSION and version != "1":
+            results[i] = (False, f"Unsupported lock version: {version!r}.")
+            continue
+        canonical = _canonical(fields[0], fields[1], fields[2])
+        h = _sigma_hash(version, canonical)
+        if h.hexdigest() != fields[3]:
+            results[i] = (False, "SΣ mismatch (immutable lock altered).")
+        else:
+            matched.append((i, version, canonical, h, fields))
+
+    # Pass 2: Paññā checksum for the SΣ survivors
+    for i, version, canonical, h, (_, _, baydin_datetime_str, s_sigma, panna_checksum) in matched:
+        if _recompute_panna(version, canonical, h, s_sigma, baydin_datetime_str) != panna_checksum:
+            results[i] = (False, "Paññā checksum mismatch (tamper suspected).")
+        else:
+            results[i] = (True, "Locks verified successfully.")
+    return results
+
+
+def create_immutable_locks_bulk(years: Sequence[int], months: Sequence[int], days: Sequence[int],
+                                hours: Sequence[int], minutes: Sequence[int]) -> List[Dict[str, str]]:
+    """
+    Create locks for many local date/times at once (e.g. bulk ingest of historical dates).
+    Equivalent to calling create_immutable_lock per row; raises ValueError on the first invalid row.
+    Rows bypass the create_immutable_lock cache, so a one-off ingest does not evict hot entries.
+    """
+    # Normalize each row exactly as create_immutable_lock does, then validate
+    rows = [
+        (operator.index(y), operator.index(m), operator.index(d), _ensure_int(h, 12), _ensure_int(mi, 0))
+        for y, m, d, h, mi in zip(years, months, days, hours, minutes)
+    ]
+    for row in rows:
+        _check_datetime_fields(*row)
+
+    fields = [_compute_baydin_fields(y, m, d, h) for y, m, d, h, _ in rows]
+
+    locks = []
+    for (y, m, d, wd, pm), (_, _, _, hour, minute) in zip(fields, rows):
+        if y < datetime.MINYEAR:
+            raise ValueError("Invalid date/time input: date value out of range")
+        sign = _SIGN_TABLE[wd * 2 + pm]
+        iso_dt = f"{y:04d}-{m:02d}-{d:02d} {hour:02d}:{minute:02d}:00"
+        locks.append(_seal_lock(_WEEKDAY_NAMES[wd], sign, iso_dt, f"{y:04d}{m:02d}{d:02d}"))
+    return locks
+
+
 # -------------------------
 # Convenience / CLI utilities
 # -------------------------
 
 
+# 'Y-M-D' or 'Y/M/D', optionally followed by ' H:M'; fields need not be zero-padded.
+_DATE_INPUT_RE = re.compile(r'(\d+)[-/](\d+)[-/](\d+)(?: +(\d+):(\d+))?')
+
+
 def parse_date_input(date_input: str) -> Tuple[int, int, int, int, int]:
     """
     Parse flexible date inputs:
@@ -217,22 +397,14 @@ def parse_date_input(date_input: str) -> Tuple[int, int, int, int, int]:
       - 'YYYY/MM/DD' accepted
     Raises ValueError on parse failure.
     """
-    date_input = date_input.strip()
-    # Try full datetime with space
-    if " " in date_input:
-        date_part, time_part = date_input.split(" ", 1)
-    else:
-        date_part, time_part = date_input, "12:00"
-
-    # Normalize separators
-    date_part = date_part.replace("/", "-")
-    parts = date_part.split("-")
-    if len(parts) != 3:
-        raise ValueError("Date must be in YYYY-MM-DD or YYYY/MM/DD format.")
+    match = _DATE_INPUT_RE.fullmatch(date_input.strip())
+    if match is None:
+        raise ValueError("Date must be in YYYY-MM-DD or YYYY/MM/DD format (optionally followed by HH:MM).")
 
-    year, month, day = map(int, parts)
-    hour, minute = map(int, time_part.split(":"))
-    return year, month, day, hour, minute
+    year, month, day, hour, minute = match.groups()
+    if hour is None:
+        return int(year), int(month), int(day), 12, 0
+    return int(year), int(month), int(day), int(hour), int(minute)
 
 
 # -------------------------
@@ -242,8 +414,8 @@ def _run_example_tests() -> None:
     print("=== SS'ISM V14 Baydin Engine — Example Tests ===\n")
 
     tests = [
-
-        ("Test Case A", 1978, 2, 7, 12, 0),     
+        ("Test Case A", 1978, 2, 7, 12, 0),
+    ]
 
     for label, y, m, d, h, mi in tests:
         print(f"--- {label} ---")
@@ -256,18 +428,36 @@ def _run_example_tests() -> None:
         ok, msg = verify_immutable_lock(lock)
         print(f"Verification: {ok} — {msg}\n")
 
+    # A tampered lock with a non-string field must be reported as altered, not raise
+    lock = create_immutable_lock(1978, 2, 7, 12, 0)
+    for field, value in (("baydin_day", 5), ("maharbote_sign", None), ("baydin_datetime", 19780207)):
+        results = [verify_immutable_lock(dict(lock, **{field: value}))]
+        results += verify_immutable_locks([dict(lock, **{field: value}), lock])
+        assert results == [(False, "SΣ mismatch (immutable lock altered).")] * 2 + [(True, "Locks verified successfully.")], results
+    print("Non-string field check: tampered locks rejected without raising.\n")
+
+    # A crafted v2 lock with a valid SΣ over a non-ASCII date must fail the Paññā check, not raise
+    forged_dt = "\U0001D7CF" * 10 + " 12:00:00"
+    forged = dict(lock, baydin_datetime=forged_dt, s_sigma_lock=hashlib.blake2s(
+        _canonical(lock["baydin_day"], lock["maharbote_sign"], forged_dt), digest_size=32
+    ).hexdigest())
+    results = [verify_immutable_lock(forged)] + verify_immutable_locks([forged, lock])
+    assert results == [(False, "Paññā checksum mismatch (tamper suspected).")] * 2 + [(True, "Locks verified successfully.")], results
+    print("Non-ASCII salt check: forged lock rejected without raising.\n")
+
 
 # -------------------------
 # Public API (for other modules)
 # -------------------------
 
 
-__all__ = [
+__all__ = (
     "create_immutable_lock",
+    "create_immutable_locks_bulk",
     "verify_immutable_lock",
+    "verify_immutable_locks",
     "parse_date_input",
-    "create_immutable_lock",
-]
+)
 
 
 # -------------------------